@@ -0,0 +1,248 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+import hashlib
+import heapq
+import json
+import os
+import re
+
+# ---------- Map definitions ----------
+# Walking times between adjacent rooms are in seconds at default crewmate speed.
+SKELD_ROOMS = [
+    "Cafeteria", "Weapons", "O2", "Navigation", "Shields", "Communications",
+    "Storage", "Admin", "Electrical", "Lower Engine", "Security", "Reactor",
+    "Upper Engine", "MedBay"
+]
+
+SKELD_EDGES = [
+    ("Cafeteria", "Weapons", 4), ("Cafeteria", "MedBay", 5), ("Cafeteria", "Upper Engine", 9),
+    ("Cafeteria", "Admin", 6), ("Cafeteria", "Storage", 6), ("Weapons", "O2", 3),
+    ("Weapons", "Navigation", 6), ("O2", "Navigation", 4), ("O2", "Shields", 6),
+    ("Navigation", "Shields", 6), ("Shields", "Communications", 4), ("Shields", "Storage", 6),
+    ("Communications", "Storage", 4), ("Storage", "Admin", 3), ("Storage", "Electrical", 5),
+    ("Storage", "Lower Engine", 9), ("Electrical", "Lower Engine", 6), ("Lower Engine", "Security", 3),
+    ("Lower Engine", "Reactor", 4), ("Lower Engine", "Upper Engine", 6), ("Upper Engine", "Reactor", 4),
+    ("Upper Engine", "Security", 3), ("Security", "Reactor", 3), ("Upper Engine", "MedBay", 4)
+]
+
+SKELD_ALIASES = {
+    "caf": "Cafeteria", "cafe": "Cafeteria", "wep": "Weapons", "weps": "Weapons",
+    "oxygen": "O2", "nav": "Navigation", "shield": "Shields", "comms": "Communications",
+    "coms": "Communications", "comm": "Communications", "store": "Storage",
+    "elec": "Electrical", "electric": "Electrical", "lower": "Lower Engine",
+    "le": "Lower Engine", "loweng": "Lower Engine", "sec": "Security",
+    "reac": "Reactor", "upper": "Upper Engine", "ue": "Upper Engine",
+    "uppereng": "Upper Engine", "med": "MedBay", "medbay": "MedBay", "medical": "MedBay"
+}
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "amogbook")
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_AGO_RE = re.compile(r"^(\d+)(?:-(\d+))?s?$")
+
+def parse_killed_ago(text):
+    # "30" / "30s" -> (30, 30), "20-60s" -> (20, 60): seconds before the case was saved
+    m = _AGO_RE.match((text or "").strip().lower())
+    if not m:
+        return None
+    a = int(m.group(1))
+    b = int(m.group(2)) if m.group(2) else a
+    return (min(a, b), max(a, b))
+
+def kill_window(saved, ago):
+    # absolute [earliest, latest] ISO kill times for a case saved at `saved`
+    t = to_seconds(saved)
+    if t is None or ago is None:
+        return None
+    return [datetime.fromtimestamp(t - ago[1]).isoformat(timespec='seconds'),
+            datetime.fromtimestamp(t - ago[0]).isoformat(timespec='seconds')]
+
+def to_seconds(stamp):
+    # accepts epoch seconds, datetime objects or ISO / HH:MM:SS strings
+    if isinstance(stamp, (int, float)):
+        return float(stamp)
+    if isinstance(stamp, datetime):
+        return stamp.timestamp()
+    if not stamp:
+        return None
+    try:
+        return datetime.fromisoformat(stamp).timestamp()
+    except ValueError:
+        pass
+    try:
+        t = datetime.strptime(stamp, "%H:%M:%S").time()
+    except ValueError:
+        return None
+    return datetime.combine(datetime.now().date(), t).timestamp()
+
+class MapModel:
+    def __init__(self, name, rooms, edges, aliases=None, cache_dir=CACHE_DIR):
+        self.name = name
+        self.rooms = list(rooms)
+        self.edges = [(a, b, float(w)) for a, b, w in edges]
+        self.index = {r: i for i, r in enumerate(self.rooms)}
+        # lookup table for free-text room names: full names, squashed names and aliases
+        self.lookup = {}
+        for r in self.rooms:
+            self.lookup[r.lower()] = r
+            self.lookup[r.lower().replace(" ", "")] = r
+        for alias, room in (aliases or {}).items():
+            self.lookup[alias.lower()] = room
+        self.cache_dir = cache_dir
+        self.dist = self._load_or_build()
+
+    def fingerprint(self):
+        payload = json.dumps([self.rooms, self.edges], sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    def cache_path(self):
+        safe = re.sub(r"[^A-Za-z0-9_-]", "_", self.name)
+        return os.path.join(self.cache_dir, f"map-{safe}-{self.fingerprint()}.json")
+
+    def _load_or_build(self):
+        path = self.cache_path()
+        n = len(self.rooms)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                table = json.load(fh)
+            if len(table) == n * n:
+                return table
+        except (OSError, ValueError):
+            pass
+        table = self._all_pairs()
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(table, fh)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # cache is an optimisation only
+        return table
+
+    def _all_pairs(self):
+        # Dijkstra from every room; the result is a flat n*n table (inf = unreachable)
+        n = len(self.rooms)
+        adj = [[] for _ in range(n)]
+        for a, b, w in self.edges:
+            ia, ib = self.index[a], self.index[b]
+            adj[ia].append((ib, w))
+            adj[ib].append((ia, w))
+        inf = float("inf")
+        table = [inf] * (n * n)
+        for src in range(n):
+            row = src * n
+            table[row + src] = 0.0
+            heap = [(0.0, src)]
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d > table[row + u]:
+                    continue
+                for v, w in adj[u]:
+                    nd = d + w
+                    if nd < table[row + v]:
+                        table[row + v] = nd
+                        heapq.heappush(heap, (nd, v))
+        return table
+
+    def resolve(self, name):
+        if not name:
+            return None
+        key = name.strip().lower()
+        return self.lookup.get(key) or self.lookup.get(key.replace(" ", ""))
+
+    def find_room(self, text):
+        # first room mentioned in free text, trying two-word names before single words
+        words = _WORD_RE.findall(text.lower())
+        for i in range(len(words)):
+            if i + 1 < len(words):
+                room = self.lookup.get(f"{words[i]} {words[i + 1]}") or self.lookup.get(words[i] + words[i + 1])
+                if room:
+                    return room
+            room = self.lookup.get(words[i])
+            if room:
+                return room
+        return None
+
+    def travel_time(self, a, b):
+        return self.dist[self.index[a] * len(self.rooms) + self.index[b]]
+
+def skeld_map(cache_dir=CACHE_DIR):
+    return MapModel("The Skeld", SKELD_ROOMS, SKELD_EDGES, SKELD_ALIASES, cache_dir)
+
+class AlibiEngine:
+    def __init__(self, map_model, colors, slack=2.0):
+        self.map = map_model
+        self.colors = {c.lower(): c for c in colors}
+        self.slack = slack
+        self.sightings = {}  # color -> (sorted times, rooms)
+
+    def clear(self):
+        self.sightings.clear()
+
+    def add_sighting(self, color, room, when):
+        t = to_seconds(when)
+        room = self.map.resolve(room)
+        if t is None or room is None:
+            return
+        times, rooms = self.sightings.setdefault(color, ([], []))
+        i = bisect_right(times, t)
+        times.insert(i, t)
+        rooms.insert(i, room)
+
+    def add_log_entry(self, when, text):
+        # "saw red and blue in elec" -> one sighting per mentioned color
+        room = self.map.find_room(text)
+        if not room:
+            return
+        for word in _WORD_RE.findall(text.lower()):
+            color = self.colors.get(word)
+            if color:
+                self.add_sighting(color, room, when)
+
+    def check_suspect(self, color, location, earliest, latest, saved=None):
+        # Flags only if no moment in the kill window [earliest, latest] fits
+        # between the sightings around it. Lines logged after the case was
+        # saved are meeting notes about the past, so they are left out.
+        entry = self.sightings.get(color)
+        room = self.map.resolve(location)
+        if not entry or room is None or earliest is None or latest is None:
+            return None
+        times, rooms = entry
+        end = bisect_right(times, saved) if saved is not None else len(times)
+        first = bisect_left(times, earliest, 0, end)
+        last = bisect_right(times, latest, 0, end)
+        # the window is cut into gaps by the sightings inside it; gap k lies
+        # between sighting k - 1 and sighting k
+        for k in range(first, last + 1):
+            start, stop = earliest, latest
+            if k > 0:
+                start = max(start, times[k - 1] + self.map.travel_time(rooms[k - 1], room) - self.slack)
+            if k < end:
+                stop = min(stop, times[k] - self.map.travel_time(room, rooms[k]) + self.slack)
+            if start <= stop:
+                return None
+        seen = [rooms[k] for k in range(max(first - 1, 0), min(last + 1, end))]
+        return f"seen in {', '.join(dict.fromkeys(seen))} around the kill, can't have been in {room}"
+
+    def check_case(self, case):
+        # without a kill window the save time says too little to rule anyone out
+        window = case.get("kill_window")
+        if not window:
+            return []
+        earliest, latest = to_seconds(window[0]), to_seconds(window[1])
+        saved = to_seconds(case.get("timestamp"))
+        flagged = []
+        for s in case.get("suspects", []):
+            reason = self.check_suspect(s, case.get("location"), earliest, latest, saved)
+            if reason:
+                flagged.append((s, reason))
+        return flagged
+
+    def check_cases(self, cases):
+        result = {}
+        for cid, case in cases.items():
+            flagged = self.check_case(case)
+            if flagged:
+                result[cid] = flagged
+        return result
@@ -1,11 +1,32 @@
+import sys
+
+if __name__ == "__main__":
+    # hand off to an already running notebook before importing the UI at all
+    from singleinstance import hand_off
+    instance_name, args, commands = hand_off("amogbook", "show")
+
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QLineEdit, QListWidget, QTextEdit,
-    QInputDialog, QMessageBox, QDialog
+    QLabel, QPushButton, QLineEdit, QListWidget, QListWidgetItem, QTextEdit,
+    QInputDialog, QMessageBox, QDialog, QComboBox, QAbstractItemView, QSlider,
+    QListView, QFileDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, QSize, QTimer
 from datetime import datetime
-import sys
+from itertools import chain
+import os
+
+from alibi import AlibiEngine, kill_window, parse_killed_ago, skeld_map
+from dupindex import DuplicateIndex
+from historyfile import HistoryError, HistoryFile, HistoryModel, write_history
+from icons import shared_icons
+from livesync import DEFAULT_PORT, SyncClient, SyncServer, SyncState, split_key
+from replay import SPEEDS, EventRecorder, ReplayController
+from timeline import TimelineWidget
+from meetings import MeetingsPanel
+from quickentry import QuickEntryBar, QuickEntryParser
+from singleinstance import InstanceServer
 
 CREWMATE_COLORS = [
     "Red", "Blue", "Green", "Pink", "Orange", "Yellow",
@@ -13,6 +34,8 @@ CREWMATE_COLORS = [
     "Maroon", "Rose", "Banana", "Gray", "Tan", "Coral"
 ]
 
+CASE_TAGS = ["resolved", "confirmed", "cleared", "unsure"]
+
 COLOR_HEX = {
     "Red": "#ff4d4d",
     "Blue": "#4d4dff",
@@ -50,17 +73,73 @@ class AmogBook(QWidget):
 
         self.cases = {}
         self.sus_levels = {}
+        self.current_session = "Session 1"
+        self.log_entries = []
+        self.sync_state = SyncState()
+        self.sync_server = None
+        self.sync_client = None
+        self.recorder = EventRecorder()
+        self.replay = None
+        self.history = None
+        self.map_model = skeld_map()
+        self.alibi = AlibiEngine(self.map_model, CREWMATE_COLORS)
+        self.quick_parser = QuickEntryParser(CREWMATE_COLORS, self.map_model)
+        self.dup_index = DuplicateIndex(self.map_model)
         self.selected_victim = None
         self.selected_suspects = []
 
+        self.icons = shared_icons(COLOR_HEX)
+
         self.tabs = QTabWidget()
         self.init_case_tab()
         self.init_sus_tab()
         self.init_log_tab()
+        self.init_timeline_tab()
+        self.init_meetings_tab()
+        self.init_history_tab()
 
         layout = QVBoxLayout()
         layout.addWidget(self.tabs)
 
+        sync_row = QHBoxLayout()
+        host_btn = QPushButton("Host Sync")
+        host_btn.clicked.connect(self.host_sync_dialog)
+        join_btn = QPushButton("Join Sync")
+        join_btn.clicked.connect(self.join_sync_dialog)
+        self.sync_label = QLabel("Sync: off")
+        sync_row.addWidget(host_btn)
+        sync_row.addWidget(join_btn)
+        sync_row.addWidget(self.sync_label, 1)
+        layout.addLayout(sync_row)
+
+        replay_row = QHBoxLayout()
+        self.replay_btn = QPushButton("Replay")
+        self.replay_btn.setCheckable(True)
+        self.replay_btn.toggled.connect(self.toggle_replay)
+        replay_row.addWidget(self.replay_btn)
+        self.replay_controls = QWidget()
+        controls = QHBoxLayout()
+        controls.setContentsMargins(0, 0, 0, 0)
+        self.play_btn = QPushButton("Play")
+        self.play_btn.clicked.connect(self.toggle_play)
+        self.speed_box = QComboBox()
+        self.speed_box.addItems([f"{s:g}x" for s in SPEEDS])
+        self.speed_box.setCurrentIndex(SPEEDS.index(1.0))
+        self.speed_box.currentIndexChanged.connect(self.set_replay_speed)
+        self.replay_slider = QSlider(Qt.Orientation.Horizontal)
+        self.replay_slider.setRange(0, 1000)
+        # playback updates the value with signals blocked, so this only fires for the user
+        self.replay_slider.valueChanged.connect(self.seek_replay)
+        self.replay_time = QLabel("")
+        controls.addWidget(self.play_btn)
+        controls.addWidget(self.speed_box)
+        controls.addWidget(self.replay_slider, 1)
+        controls.addWidget(self.replay_time)
+        self.replay_controls.setLayout(controls)
+        self.replay_controls.hide()
+        replay_row.addWidget(self.replay_controls, 1)
+        layout.addLayout(replay_row)
+
         version_label = QLabel("AmogBook v1.1 — Codename: Nebula")
         version_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         layout.addWidget(version_label)
@@ -72,6 +151,9 @@ class AmogBook(QWidget):
         tab = QWidget()
         layout = QVBoxLayout()
 
+        # Quick entry: a whole case or log line in one go
+        layout.addWidget(QuickEntryBar(self.quick_parser, self.submit_quick_entry))
+
         # Victim selector
         self.victim_label = QLabel("Victim: None")
         layout.addWidget(self.victim_label)
@@ -82,6 +164,11 @@ class AmogBook(QWidget):
         layout.addWidget(QLabel("Location"))
         layout.addWidget(self.location_input)
 
+        self.killed_input = QLineEdit()
+        self.killed_input.setPlaceholderText("optional, e.g. 30 or 20-60")
+        layout.addWidget(QLabel("Killed (seconds ago)"))
+        layout.addWidget(self.killed_input)
+
         # Dynamic suspect area
         layout.addWidget(QLabel("Suspects"))
         self.suspect_layout = QVBoxLayout()
@@ -97,8 +184,21 @@ class AmogBook(QWidget):
         layout.addWidget(QLabel("Notes"))
         layout.addWidget(self.notes_input)
 
+        # Sessions
+        session_row = QHBoxLayout()
+        self.session_box = QComboBox()
+        self.session_box.addItem(self.current_session)
+        self.session_box.currentTextChanged.connect(self.switch_session)
+        new_session_btn = QPushButton("New Session")
+        new_session_btn.clicked.connect(self.new_session)
+        session_row.addWidget(QLabel("Session"))
+        session_row.addWidget(self.session_box, 1)
+        session_row.addWidget(new_session_btn)
+        layout.addLayout(session_row)
+
         # Case list
         self.case_list = QListWidget()
+        self.case_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.case_list.itemDoubleClicked.connect(self.view_case)
         layout.addWidget(self.case_list)
 
@@ -108,10 +208,22 @@ class AmogBook(QWidget):
         save_btn.clicked.connect(self.save_case)
         remove_btn = QPushButton("Remove Case")
         remove_btn.clicked.connect(self.remove_case)
+        alibi_btn = QPushButton("Check Alibis")
+        alibi_btn.clicked.connect(self.check_alibis)
         btn_row.addWidget(save_btn)
         btn_row.addWidget(remove_btn)
+        btn_row.addWidget(alibi_btn)
         layout.addLayout(btn_row)
 
+        batch_row = QHBoxLayout()
+        tag_btn = QPushButton("Tag Selected")
+        tag_btn.clicked.connect(self.tag_selected_cases)
+        move_btn = QPushButton("Move to Session")
+        move_btn.clicked.connect(self.move_selected_cases)
+        batch_row.addWidget(tag_btn)
+        batch_row.addWidget(move_btn)
+        layout.addLayout(batch_row)
+
         tab.setLayout(layout)
         self.tabs.addTab(tab, "Case")
 
@@ -127,7 +239,9 @@ class AmogBook(QWidget):
             btn.setFixedSize(34, 34)
             btn.setToolTip(color)
             hexc = COLOR_HEX.get(color, "#888888")
-            btn.setStyleSheet(f"background-color: {hexc}; border-radius: 17px; border: 1px solid #222;")
+            btn.setIcon(self.icons.icon(color, 26))
+            btn.setIconSize(QSize(26, 26))
+            btn.setStyleSheet("border-radius: 17px; border: 1px solid #222;")
             btn.clicked.connect(lambda _, c=color: callback(c))
             name_lbl = QLabel(color)
             name_lbl.setAlignment(Qt.AlignmentFlag.AlignHCenter)
@@ -217,14 +331,20 @@ class AmogBook(QWidget):
         level, ok = QInputDialog.getDouble(self, "Sus Level", f"{color} sus %:", 50.0, 0.0, 100.0, 1)
         if ok:
             self.sus_levels[color] = level
+            self.record_change("sus", color, level)
+            self.note_sus_change(color, level)
             self.refresh_sus_list()
 
     def edit_sus(self, item):
+        if self.replay:
+            return
         color = item.text().split(":")[0]
         current = self.sus_levels.get(color, 50.0)
         level, ok = QInputDialog.getDouble(self, "Edit Sus", f"{color} sus %:", current, 0.0, 100.0, 1)
         if ok:
             self.sus_levels[color] = level
+            self.record_change("sus", color, level)
+            self.note_sus_change(color, level)
             self.refresh_sus_list()
 
     def remove_sus(self):
@@ -234,12 +354,14 @@ class AmogBook(QWidget):
         color = item.text().split(":")[0]
         if color in self.sus_levels:
             del self.sus_levels[color]
+            self.record_change("sus", color, None)
+            self.note_sus_change(color, None)
         self.refresh_sus_list()
 
     def refresh_sus_list(self):
         self.sus_list.clear()
-        for color, level in sorted(self.sus_levels.items(), key=lambda x: -x[1]):
-            self.sus_list.addItem(f"{color}: {level:.1f}%")
+        for color, level in sorted(self.shown_sus().items(), key=lambda x: -x[1]):
+            self.sus_list.addItem(QListWidgetItem(self.icons.icon(color), f"{color}: {level:.1f}%"))
 
     # ---------- Log tab ----------
     def init_log_tab(self):
@@ -259,23 +381,205 @@ class AmogBook(QWidget):
     def add_log(self):
         entry, ok = QInputDialog.getText(self, "Log Entry", "Note:")
         if ok and entry:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.log_area.append(f"[{timestamp}] {entry}")
+            self.append_log(entry)
+
+    def append_log(self, entry):
+        stamp = datetime.now().isoformat(timespec='seconds')
+        log_id = f"{self.sync_state.origin}-{len(self.log_entries)}"
+        self.show_log_entry(stamp, entry)
+        self.record_change("log", log_id, [stamp, entry])
+
+    def show_log_entry(self, stamp, entry):
+        self.log_entries.append((stamp, entry))
+        self.alibi.add_log_entry(stamp, entry)
+        self.timeline.add_event("log", stamp, entry)
+        if not self.replay:
+            self.log_area.append(self.format_log(stamp, entry))
+
+    def format_log(self, stamp, entry):
+        timestamp = datetime.fromisoformat(stamp).strftime("%H:%M:%S")
+        return f"[{timestamp}] {entry}"
+
+    def refresh_log_area(self, entries):
+        self.log_area.setPlainText("\n".join(self.format_log(stamp, entry) for stamp, entry in entries))
+
+    # ---------- Timeline tab ----------
+    def init_timeline_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout()
+        self.timeline = TimelineWidget(COLOR_HEX)
+        layout.addWidget(self.timeline)
+        fit_btn = QPushButton("Fit All")
+        fit_btn.clicked.connect(self.timeline.fit_all)
+        layout.addWidget(fit_btn)
+        tab.setLayout(layout)
+        self.tabs.addTab(tab, "Timeline")
+
+    # ---------- Meetings tab ----------
+    def init_meetings_tab(self):
+        self.meetings = MeetingsPanel(CREWMATE_COLORS, lambda: list(self.cases))
+        self.tabs.addTab(self.meetings, "Meetings")
+
+    def note_sus_change(self, color, level):
+        label = f"{color}: {level:.1f}%" if level is not None else f"{color}: cleared"
+        self.timeline.add_event("sus", datetime.now(), label, color)
+
+    # ---------- History tab ----------
+    def init_history_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout()
+        btn_row = QHBoxLayout()
+        open_btn = QPushButton("Open History...")
+        open_btn.clicked.connect(self.open_history_dialog)
+        archive_btn = QPushButton("Archive Cases...")
+        archive_btn.clicked.connect(self.archive_cases)
+        btn_row.addWidget(open_btn)
+        btn_row.addWidget(archive_btn)
+        layout.addLayout(btn_row)
+
+        self.history_filter = QComboBox()
+        self.history_filter.addItems(["All victims"] + CREWMATE_COLORS)
+        self.history_filter.currentIndexChanged.connect(self.filter_history)
+        layout.addWidget(self.history_filter)
+
+        self.history_label = QLabel("No history file open")
+        layout.addWidget(self.history_label)
+        # uniform rows let the view size itself without asking for every row
+        self.history_view = QListView()
+        self.history_view.setUniformItemSizes(True)
+        self.history_model = HistoryModel(self.icons)
+        self.history_view.setModel(self.history_model)
+        self.history_view.doubleClicked.connect(self.show_history_case)
+        layout.addWidget(self.history_view)
+
+        tab.setLayout(layout)
+        self.tabs.addTab(tab, "History")
+
+    def open_history_dialog(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open History", "", "AmogBook history (*.amgh);;All files (*)")
+        if path:
+            self.open_history(path)
+
+    def open_history(self, path):
+        try:
+            history = HistoryFile(path)
+        except (OSError, HistoryError) as e:
+            QMessageBox.warning(self, "History", str(e))
+            return
+        self.close_history()
+        self.history = history
+        self.history_filter.setCurrentIndex(0)
+        self.history_model.set_history(history)
+        self.history_label.setText(f"{len(history)} cases in {os.path.basename(path)}")
+
+    def close_history(self):
+        if self.history is not None:
+            self.history_model.set_history(None)
+            self.history.close()
+            self.history = None
+
+    def filter_history(self, index):
+        if self.history is None:
+            return
+        rows = None if index == 0 else self.history.rows_for_victim(CREWMATE_COLORS[index - 1])
+        self.history_model.set_history(self.history, rows)
+
+    def show_history_case(self, index):
+        cid, case = self.history.record(self.history_model.source_row(index.row()))
+        QMessageBox.information(self, "Archived Case", "\n".join([
+            cid,
+            f"Victim: {case['victim']}",
+            f"Location: {case['location']}",
+            "Suspects: " + (", ".join(case["suspects"]) or "-"),
+            f"Notes: {case['notes']}",
+            f"Session: {case['session']}",
+            "Tags: " + (", ".join(case["tags"]) or "-")
+        ]))
+
+    def archive_cases(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Archive Cases", "history.amgh", "AmogBook history (*.amgh)")
+        if not path:
+            return
+        # the open history is carried over so one file accumulates every session;
+        # a live case replaces the archived copy with the same id
+        old = self.history
+        items = chain(old.items(skip=self.cases) if old else (), self.cases.items())
+        if old is not None and os.path.abspath(old.path) == os.path.abspath(path):
+            items = list(items)
+            self.close_history()
+        try:
+            count = write_history(path, items, CREWMATE_COLORS)
+        except OSError as e:
+            QMessageBox.warning(self, "History", str(e))
+            return
+        self.open_history(path)
+        QMessageBox.information(self, "History", f"Archived {count} cases to {os.path.basename(path)}.")
 
     # ---------- Case persistence / editor ----------
+    def add_case(self, victim, location, suspects, notes, killed=None):
+        # killed: optional (min, max) seconds between the kill and saving
+        stamp = datetime.now().isoformat(timespec='seconds')
+        window = kill_window(stamp, killed)
+        duplicate = self.find_duplicate({"victim": victim, "location": location, "suspects": suspects, "timestamp": stamp})
+        if duplicate:
+            return self.merge_into_case(duplicate, suspects, notes, window)
+        case_id = f"{victim} @ {location} ({datetime.now().strftime('%H:%M:%S')})"
+        if case_id in self.cases:
+            suffix = 1
+            while f"{case_id}#{suffix}" in self.cases:
+                suffix += 1
+            case_id = f"{case_id}#{suffix}"
+        self.cases[case_id] = {
+            "victim": victim,
+            "location": location,
+            "suspects": suspects,
+            "notes": notes,
+            "timestamp": stamp,
+            "session": self.current_session,
+            "tags": []
+        }
+        if window:
+            self.cases[case_id]["kill_window"] = window
+        self.dup_index.add(case_id, self.cases[case_id])
+        self.record_change("case", case_id, self.cases[case_id])
+        self.case_list.addItem(self.make_case_item(case_id, self.cases[case_id]))
+        self.timeline.add_event("case", self.cases[case_id]["timestamp"], case_id, victim)
+        return case_id
+
+    def find_duplicate(self, case):
+        matches = self.dup_index.find(case)
+        if not matches:
+            return None
+        reply = QMessageBox.question(
+            self, "Possible Duplicate",
+            f"This looks like an existing case:\n{matches[0]}\n\nMerge into it?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        return matches[0] if reply == QMessageBox.StandardButton.Yes else None
+
+    def merge_into_case(self, cid, suspects, notes, window=None):
+        case = self.cases[cid]
+        if window and not case.get("kill_window"):
+            case["kill_window"] = window
+        for s in suspects:
+            if s not in case["suspects"]:
+                case["suspects"].append(s)
+        if notes and notes not in case["notes"]:
+            case["notes"] = f"{case['notes']} | {notes}" if case["notes"] else notes
+        self.dup_index.update(cid, case)
+        self.record_change("case", cid, case)
+        return cid
+
     def save_case(self):
         if not self.selected_victim or not self.location_input.text():
             QMessageBox.warning(self, "Missing Info", "Victim and location are required.")
             return
+        killed = parse_killed_ago(self.killed_input.text())
+        if self.killed_input.text().strip() and killed is None:
+            QMessageBox.warning(self, "Killed", "Use seconds ago, e.g. 30 or 20-60.")
+            return
         suspects = [s for s in self.selected_suspects if s]
-        case_id = f"{self.selected_victim} @ {self.location_input.text()} ({datetime.now().strftime('%H:%M:%S')})"
-        self.cases[case_id] = {
-            "victim": self.selected_victim,
-            "location": self.location_input.text(),
-            "suspects": suspects,
-            "notes": self.notes_input.text()
-        }
-        self.case_list.addItem(case_id)
+        self.add_case(self.selected_victim, self.location_input.text(), suspects, self.notes_input.text(), killed)
         self.selected_suspects.clear()
         while self.suspect_layout.count():
             w = self.suspect_layout.takeAt(0).widget()
@@ -283,20 +587,324 @@ class AmogBook(QWidget):
                 w.deleteLater()
         self.add_suspect_slot()
         self.location_input.clear()
+        self.killed_input.clear()
         self.notes_input.clear()
 
+    def submit_quick_entry(self, entry):
+        if entry.kind == "log":
+            self.append_log(entry.text)
+        else:
+            self.add_case(entry.victim, entry.location, entry.suspects, entry.notes, entry.killed)
+
     def remove_case(self):
-        item = self.case_list.currentItem()
-        if not item:
+        self.remove_cases(self.selected_case_ids())
+
+    # ---------- Sessions / batch operations ----------
+    def new_session(self):
+        name, ok = QInputDialog.getText(self, "New Session", "Session name:")
+        name = name.strip()
+        if not ok or not name:
             return
-        cid = item.text()
-        if cid in self.cases:
-            del self.cases[cid]
-        self.case_list.takeItem(self.case_list.row(item))
+        self.add_session(name)
+        self.session_box.setCurrentText(name)
+
+    def add_session(self, name):
+        if self.session_box.findText(name) < 0:
+            self.session_box.addItem(name)
+
+    def switch_session(self, name):
+        if not name:
+            return
+        self.current_session = name
+        self.refresh_case_list()
+
+    def make_case_item(self, cid, case):
+        item = QListWidgetItem(self.icons.icon(case["victim"]), cid)
+        self.style_case_item(item, case)
+        return item
+
+    def style_case_item(self, item, case):
+        tags = case.get("tags", [])
+        item.setToolTip("Tags: " + ", ".join(tags) if tags else "")
+        if "resolved" in tags:
+            item.setForeground(QColor("#888888"))
+
+    def refresh_case_list(self):
+        # rebuild the visible session in one pass with painting suspended
+        self.case_list.setUpdatesEnabled(False)
+        self.case_list.clear()
+        for cid, case in self.shown_cases().items():
+            if case.get("session") == self.current_session:
+                self.case_list.addItem(self.make_case_item(cid, case))
+        self.case_list.setUpdatesEnabled(True)
+
+    def selected_case_ids(self):
+        return [item.text() for item in self.case_list.selectedItems()]
+
+    def remove_cases(self, cids):
+        removed = []
+        for cid in cids:
+            case = self.cases.pop(cid, None)
+            if case is not None:
+                removed.append(cid)
+                self.timeline.remove_event("case", case.get("timestamp"), cid, case.get("victim"))
+        for cid in removed:
+            self.dup_index.remove(cid)
+            self.record_change("case", cid, None)
+        if removed:
+            self.refresh_case_list()
+        return removed
+
+    def tag_cases(self, cids, tag):
+        tagged = []
+        for cid in cids:
+            case = self.cases.get(cid)
+            if case is None:
+                continue
+            tags = case.setdefault("tags", [])
+            if tag not in tags:
+                tags.append(tag)
+                tagged.append(cid)
+        for cid in tagged:
+            self.record_change("case", cid, self.cases[cid])
+        if tagged:
+            # restyle the affected rows in place instead of rebuilding the list
+            pending = set(tagged)
+            self.case_list.setUpdatesEnabled(False)
+            for row in range(self.case_list.count()):
+                item = self.case_list.item(row)
+                if item.text() in pending:
+                    self.style_case_item(item, self.cases[item.text()])
+            self.case_list.setUpdatesEnabled(True)
+        return tagged
+
+    def move_cases(self, cids, session):
+        moved = []
+        for cid in cids:
+            case = self.cases.get(cid)
+            if case is not None and case.get("session") != session:
+                case["session"] = session
+                moved.append(cid)
+        for cid in moved:
+            self.record_change("case", cid, self.cases[cid])
+        self.add_session(session)
+        if moved:
+            self.refresh_case_list()
+        return moved
+
+    def tag_selected_cases(self):
+        cids = self.selected_case_ids()
+        if not cids:
+            return
+        tag, ok = QInputDialog.getItem(self, "Tag Cases", f"Tag for {len(cids)} case(s):", CASE_TAGS, 0, True)
+        tag = tag.strip()
+        if ok and "," in tag:
+            # the history archive stores a case's tags as one comma-joined string
+            QMessageBox.warning(self, "Tag Cases", "Tags can't contain commas.")
+            return
+        if ok and tag:
+            self.tag_cases(cids, tag)
+
+    def move_selected_cases(self):
+        cids = self.selected_case_ids()
+        if not cids:
+            return
+        sessions = [self.session_box.itemText(i) for i in range(self.session_box.count())]
+        session, ok = QInputDialog.getItem(self, "Move Cases", f"Move {len(cids)} case(s) to session:", sessions, 0, True)
+        session = session.strip()
+        if ok and session:
+            self.move_cases(cids, session)
+
+    # ---------- Live sync ----------
+    def record_change(self, kind, key, value):
+        row = self.sync_state.set_local(f"{kind}:{key}", value)
+        self.recorder.record(row[0], row[3])
+        if self.sync_client:
+            self.sync_client.publish(row)
+
+    def apply_remote(self, rows):
+        # rows already won the last-writer merge; apply them all, then refresh once
+        cases_changed = sus_changed = False
+        for key, _, _, value in rows:
+            self.recorder.record(key, value)
+            kind, rid = split_key(key)
+            if kind == "case":
+                if value is None:
+                    old = self.cases.pop(rid, None)
+                    if old is not None:
+                        self.timeline.remove_event("case", old.get("timestamp"), rid, old.get("victim"))
+                    self.dup_index.remove(rid)
+                else:
+                    if rid not in self.cases:
+                        self.timeline.add_event("case", value.get("timestamp"), rid, value.get("victim"))
+                    self.cases[rid] = value
+                    self.dup_index.update(rid, value)
+                    self.add_session(value.get("session") or self.current_session)
+                cases_changed = True
+            elif kind == "sus":
+                if value is None:
+                    self.sus_levels.pop(rid, None)
+                else:
+                    self.sus_levels[rid] = float(value)
+                self.note_sus_change(rid, self.sus_levels.get(rid))
+                sus_changed = True
+            elif kind == "log" and value:
+                self.show_log_entry(value[0], value[1])
+        if self.replay:
+            return  # the live view is rebuilt when replay ends
+        if cases_changed:
+            self.refresh_case_list()
+        if sus_changed:
+            self.refresh_sus_list()
+
+    def host_sync(self, port=DEFAULT_PORT, lan=False):
+        if self.sync_server is None:
+            self.sync_server = SyncServer(self)
+            if not self.sync_server.listen(port, lan):
+                self.sync_server = None
+                QMessageBox.warning(self, "Sync", f"Could not listen on port {port}.")
+                return
+        self.join_sync("127.0.0.1", self.sync_server.port())
+
+    def join_sync(self, host, port=DEFAULT_PORT):
+        if self.sync_client:
+            self.sync_client.close()
+            self.sync_client.deleteLater()
+        self.sync_client = SyncClient(self.sync_state, self.apply_remote, self.sync_label.setText, self)
+        self.sync_client.connect_to(host, port)
+
+    def host_sync_dialog(self):
+        port, ok = QInputDialog.getInt(self, "Host Sync", "Port:", DEFAULT_PORT, 1024, 65535)
+        if not ok:
+            return
+        reply = QMessageBox.question(
+            self, "Host Sync", "Let other machines on the network join?\nNo keeps the server on this computer only.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No
+        )
+        self.host_sync(port, reply == QMessageBox.StandardButton.Yes)
+
+    def join_sync_dialog(self):
+        address, ok = QInputDialog.getText(self, "Join Sync", "Host:port", text=f"127.0.0.1:{DEFAULT_PORT}")
+        if not ok or not address:
+            return
+        host, _, port = address.strip().rpartition(":")
+        if not port.isdigit():
+            QMessageBox.warning(self, "Sync", "Expected host:port.")
+            return
+        self.join_sync(host or "127.0.0.1", int(port))
+
+    # ---------- Session replay ----------
+    def shown_cases(self):
+        return self.replay.state["case"] if self.replay else self.cases
+
+    def shown_sus(self):
+        return self.replay.state["sus"] if self.replay else self.sus_levels
+
+    def set_read_only(self, read_only):
+        # the Case, Sus and Log tabs stay browsable but cannot edit anything
+        for i in range(3):
+            page = self.tabs.widget(i)
+            for w in page.findChildren(QPushButton) + page.findChildren(QLineEdit):
+                w.setEnabled(not read_only)
+
+    def toggle_replay(self, on):
+        if on and self.replay is None:
+            span = self.recorder.span()
+            if not span:
+                QMessageBox.information(self, "Replay", "Nothing recorded yet.")
+                self.replay_btn.setChecked(False)
+                return
+            self.replay = ReplayController(self.recorder, self.show_replay_state, self)
+            self.set_read_only(True)
+            self.replay_controls.show()
+            self.replay.seek(span[0])
+        elif not on and self.replay is not None:
+            self.replay.pause()
+            self.replay.deleteLater()
+            self.replay = None
+            self.play_btn.setText("Play")
+            self.replay_controls.hide()
+            self.set_read_only(False)
+            self.refresh_case_list()
+            self.refresh_sus_list()
+            self.refresh_log_area(self.log_entries)
+
+    def toggle_play(self):
+        if not self.replay:
+            return
+        if self.replay.is_playing():
+            self.replay.pause()
+        else:
+            self.replay.speed = SPEEDS[self.speed_box.currentIndex()]
+            self.replay.play()
+        self.play_btn.setText("Pause" if self.replay.is_playing() else "Play")
+
+    def set_replay_speed(self, index):
+        if self.replay:
+            self.replay.speed = SPEEDS[index]
+
+    def seek_replay(self, value):
+        span = self.recorder.span()
+        if self.replay and span:
+            self.replay.seek(span[0] + (span[1] - span[0]) * value / 1000)
+
+    def show_replay_state(self, state, position, changed):
+        span = self.recorder.span()
+        if span and span[1] > span[0] and not self.replay_slider.isSliderDown():
+            self.replay_slider.blockSignals(True)
+            self.replay_slider.setValue(round((position - span[0]) / (span[1] - span[0]) * 1000))
+            self.replay_slider.blockSignals(False)
+        self.replay_time.setText(datetime.fromtimestamp(position).strftime("%H:%M:%S"))
+        if not self.replay.is_playing():
+            self.play_btn.setText("Play")
+        if changed:
+            self.refresh_case_list()
+            self.refresh_sus_list()
+            self.refresh_log_area(state["log"].values())
+
+    # ---------- Commands from other launches ----------
+    def handle_command(self, command):
+        action = command.get("action")
+        if action in ("show", "overlay"):
+            self.showNormal()
+            self.raise_()
+            self.activateWindow()
+        elif action == "log" and command.get("text"):
+            self.append_log(command["text"])
+        elif action == "open" and command.get("case"):
+            self.open_case(command["case"])
+        elif action == "host_sync":
+            self.host_sync(command.get("port", DEFAULT_PORT), bool(command.get("lan")))
+        elif action == "join_sync":
+            self.join_sync(command.get("host", "127.0.0.1"), command.get("port", DEFAULT_PORT))
+
+    def open_case(self, cid):
+        case = self.cases.get(cid)
+        if not case:
+            return
+        if case.get("session") != self.current_session:
+            self.session_box.setCurrentText(case["session"])
+        matches = self.case_list.findItems(cid, Qt.MatchFlag.MatchExactly)
+        if not matches:
+            return
+        self.tabs.setCurrentIndex(0)
+        self.case_list.setCurrentItem(matches[0])
+        QTimer.singleShot(0, lambda: self.view_case(matches[0]))
+
+    def check_alibis(self):
+        flagged = self.alibi.check_cases(self.cases)
+        if not flagged:
+            QMessageBox.information(self, "Alibis", "No impossible alibis found.\nOnly cases with a kill time are checked.")
+            return
+        lines = []
+        for cid, entries in flagged.items():
+            lines.append(cid)
+            lines.extend(f"  {color}: {reason}" for color, reason in entries)
+        QMessageBox.warning(self, "Impossible Alibis", "\n".join(lines))
 
     def view_case(self, item):
         cid = item.text()
-        case = self.cases.get(cid)
+        case = self.shown_cases().get(cid)
         if not case:
             return
 
@@ -377,16 +985,22 @@ class AmogBook(QWidget):
         dialog.exec()
 
     def update_case(self, cid, location, notes, suspects, dialog):
-        if cid not in self.cases:
+        if self.replay or cid not in self.cases:
             return
         self.cases[cid]["location"] = location
         self.cases[cid]["notes"] = notes
         self.cases[cid]["suspects"] = suspects
+        self.dup_index.update(cid, self.cases[cid])
+        self.record_change("case", cid, self.cases[cid])
         dialog.accept()
 
 # ---------- main ----------
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = AmogBook()
+    if not args.new_instance:
+        instance_server = InstanceServer(instance_name, window.handle_command)
     window.show()
+    for command in commands:
+        window.handle_command(command)
     sys.exit(app.exec())
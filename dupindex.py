@@ -0,0 +1,75 @@
+from alibi import to_seconds
+
+DEFAULT_WINDOW = 90  # seconds; saves further apart than this are different kills
+
+class DuplicateIndex:
+    # Cases are hashed into buckets keyed by (victim, room, time slot). A new
+    # case only has to look at its own slot and the two neighbours, so a
+    # lookup costs the same at 10 or 100k cases. The suspect set is compared
+    # on the few candidates instead of being part of the key, so a second
+    # entry with one more or one fewer suspect still matches.
+    def __init__(self, map_model=None, window=DEFAULT_WINDOW, min_overlap=0.5):
+        self.map = map_model
+        self.window = window
+        self.min_overlap = min_overlap
+        self.buckets = {}
+        self.keys = {}  # cid -> (bucket key, seconds, suspects)
+
+    def normalize_location(self, location):
+        room = self.map.resolve(location) if self.map else None
+        return room or " ".join((location or "").lower().split())
+
+    def _key(self, case):
+        t = to_seconds(case.get("timestamp"))
+        if t is None:
+            return None, None
+        slot = int(t // self.window)
+        return (case.get("victim"), self.normalize_location(case.get("location")), slot), t
+
+    def add(self, cid, case):
+        key, t = self._key(case)
+        if key is None:
+            return
+        self.buckets.setdefault(key, set()).add(cid)
+        self.keys[cid] = (key, t, frozenset(case.get("suspects", [])))
+
+    def remove(self, cid):
+        entry = self.keys.pop(cid, None)
+        if entry is None:
+            return
+        bucket = self.buckets.get(entry[0])
+        if bucket is not None:
+            bucket.discard(cid)
+            if not bucket:
+                del self.buckets[entry[0]]
+
+    def update(self, cid, case):
+        self.remove(cid)
+        self.add(cid, case)
+
+    def clear(self):
+        self.buckets.clear()
+        self.keys.clear()
+
+    def find(self, case, exclude=None):
+        # likely duplicates of `case`, best match first
+        key, t = self._key(case)
+        if key is None:
+            return []
+        suspects = frozenset(case.get("suspects", []))
+        victim, room, slot = key
+        matches = []
+        for s in (slot - 1, slot, slot + 1):
+            for cid in self.buckets.get((victim, room, s), ()):
+                if cid == exclude:
+                    continue
+                _, other_t, other_suspects = self.keys[cid]
+                if abs(other_t - t) > self.window:
+                    continue
+                union = suspects | other_suspects
+                overlap = len(suspects & other_suspects) / len(union) if union else 1.0
+                # an empty suspect list on either side says nothing against a match
+                if overlap >= self.min_overlap or not suspects or not other_suspects:
+                    matches.append((overlap, -abs(other_t - t), cid))
+        matches.sort(reverse=True)
+        return [cid for _, _, cid in matches]
@@ -0,0 +1,211 @@
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+from datetime import datetime
+from functools import lru_cache
+import numpy as np
+import mmap
+import os
+import struct
+
+# Layout (little endian):
+#   header        MAGIC, version, record count, string count, color count,
+#                 then the byte offsets of the three sections below
+#   records       fixed-width RECORD structs, row i lives at records + i * size
+#   string index  (offset, length) pairs into the string data
+#   string data   UTF-8, every distinct string stored once
+# String ids 0..color_count-1 are the color names, so suspects fit in a bitmask.
+MAGIC = b"AMGH"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII4xQQQ")
+RECORD = struct.Struct("<dIIIIIII")  # time, case id, victim, location, notes, session, tags, suspects
+RECORD_DTYPE = np.dtype([("time", "<f8"), ("case", "<u4"), ("victim", "<u4"), ("location", "<u4"),
+                         ("notes", "<u4"), ("session", "<u4"), ("tags", "<u4"), ("suspects", "<u4")])
+STRING_REF = struct.Struct("<II")
+NO_STRING = 0xFFFFFFFF
+
+class HistoryError(Exception):
+    pass
+
+def write_history(path, items, colors):
+    # items: iterable of (case_id, case dict); written to a temp file, then swapped in
+    strings = {}
+    blob = bytearray()
+    refs = bytearray()
+
+    def sid(text):
+        if text is None:
+            return NO_STRING
+        i = strings.get(text)
+        if i is None:
+            data = text.encode("utf-8")
+            i = strings[text] = len(strings)
+            refs.extend(STRING_REF.pack(len(blob), len(data)))
+            blob.extend(data)
+        return i
+
+    colors = list(colors)
+    for c in colors:
+        sid(c)
+    bit = {c: 1 << i for i, c in enumerate(colors)}
+    records = bytearray()
+    count = 0
+    for cid, case in items:
+        stamp = case.get("timestamp")
+        try:
+            t = datetime.fromisoformat(stamp).timestamp() if stamp else 0.0
+        except ValueError:
+            t = 0.0
+        mask = 0
+        for s in case.get("suspects", []):
+            mask |= bit.get(s, 0)
+        records.extend(RECORD.pack(
+            t, sid(cid), sid(case.get("victim")), sid(case.get("location")), sid(case.get("notes") or ""),
+            sid(case.get("session")), sid(",".join(case.get("tags", []))), mask
+        ))
+        count += 1
+
+    records_at = HEADER.size
+    index_at = records_at + len(records)
+    data_at = index_at + len(refs)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count, len(strings), len(colors),
+                             records_at, index_at, data_at))
+        fh.write(records)
+        fh.write(refs)
+        fh.write(blob)
+    os.replace(tmp, path)
+    return count
+
+class HistoryFile:
+    # Opening only maps the file and reads the header; rows and strings are
+    # decoded when something asks for them, so resident memory follows what
+    # is viewed rather than the file size.
+    def __init__(self, path):
+        self.path = path
+        self._fh = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._fh.close()
+            raise HistoryError(f"{path} is empty")
+        try:
+            (magic, version, record_size, self.count, self.string_count, color_count,
+             self.records_at, self.index_at, self.data_at) = HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            self.close()
+            raise HistoryError(f"{path} is not an AmogBook history file")
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.close()
+            raise HistoryError(f"{path} is not an AmogBook history file")
+        # every section has to fit before anything is read out of it
+        if not (HEADER.size <= self.records_at
+                and self.records_at + self.count * RECORD.size <= self.index_at
+                and self.index_at + self.string_count * STRING_REF.size <= self.data_at <= len(self._map)
+                and color_count <= self.string_count):
+            self.close()
+            raise HistoryError(f"{path} is truncated or damaged")
+        try:
+            self.colors = [self.string(i, "strict") for i in range(color_count)]
+        except (struct.error, UnicodeDecodeError):
+            self.close()
+            raise HistoryError(f"{path} has a damaged color table")
+        self.string = lru_cache(maxsize=8192)(self.string)
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._fh.close()
+
+    def string(self, i, errors="replace"):
+        # a bad id or byte in one row shows as missing/garbled text, it never raises
+        if not 0 <= i < self.string_count:
+            return None
+        offset, length = STRING_REF.unpack_from(self._map, self.index_at + i * STRING_REF.size)
+        start = self.data_at + offset
+        return self._map[start:start + length].decode("utf-8", errors)
+
+    def _row(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return RECORD.unpack_from(self._map, self.records_at + i * RECORD.size)
+
+    def case_id(self, i):
+        return self.string(self._row(i)[1])
+
+    def victim_id(self, i):
+        return self._row(i)[2]
+
+    def record(self, i):
+        t, cid, victim, location, notes, session, tags, mask = self._row(i)
+        return self.string(cid), {
+            "victim": self.string(victim),
+            "location": self.string(location),
+            "suspects": [c for b, c in enumerate(self.colors) if mask >> b & 1],
+            "notes": self.string(notes) or "",
+            "timestamp": self._stamp(t),
+            "session": self.string(session),
+            "tags": [tag for tag in (self.string(tags) or "").split(",") if tag]
+        }
+
+    @staticmethod
+    def _stamp(t):
+        # a damaged time field reads as unknown, like a bad string id
+        try:
+            return datetime.fromtimestamp(t).isoformat(timespec='seconds') if t else ""
+        except (OverflowError, OSError, ValueError):
+            return ""
+
+    def items(self, skip=()):
+        # rows whose case id is in `skip` are passed over before the rest is decoded
+        for i in range(self.count):
+            if skip and self.case_id(i) in skip:
+                continue
+            yield self.record(i)
+
+    def rows_for_victim(self, color):
+        # one vectorised compare over the victim column of the mapped records
+        if color not in self.colors:
+            return np.empty(0, dtype=np.uint32)
+        target = self.colors.index(color)
+        records = np.frombuffer(self._map, dtype=RECORD_DTYPE, count=self.count, offset=self.records_at)
+        rows = np.flatnonzero(records["victim"] == target).astype(np.uint32)
+        del records  # the mmap can't be closed while a view of it is alive
+        return rows
+
+class HistoryModel(QAbstractListModel):
+    def __init__(self, icons=None, parent=None):
+        super().__init__(parent)
+        self.icons = icons
+        self.history = None
+        self.rows = None  # optional filtered row numbers
+
+    def set_history(self, history, rows=None):
+        self.beginResetModel()
+        self.history = history
+        self.rows = rows
+        self.endResetModel()
+
+    def source_row(self, row):
+        return self.rows[row] if self.rows is not None else row
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.history is None:
+            return 0
+        return len(self.rows) if self.rows is not None else len(self.history)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or self.history is None:
+            return None
+        row = self.source_row(index.row())
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.history.case_id(row)
+        if role == Qt.ItemDataRole.DecorationRole and self.icons:
+            return self.icons.icon(self.history.string(self.history.victim_id(row)))
+        if role == Qt.ItemDataRole.ToolTipRole:
+            _, case = self.history.record(row)
+            return f"{case['victim']} @ {case['location']} — sus: {', '.join(case['suspects']) or '-'}"
+        return None
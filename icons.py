@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QColor, QIcon, QPainter, QPen, QPixmap
+from PyQt6.QtCore import QRectF, Qt
+
+DEFAULT_HEX = "#888888"
+
+class IconCache:
+    # Renders each crewmate color once per (size, DPI) and hands out shared
+    # pixmaps/icons. Qt pixmaps are implicitly shared, so every list row using
+    # an icon from here points at the same pixel data.
+    def __init__(self, color_hex, max_entries=256):
+        self.color_hex = dict(color_hex)
+        self.max_entries = max_entries
+        self._pixmaps = OrderedDict()
+        self._icons = OrderedDict()
+
+    def _touch(self, store, key, factory):
+        value = store.get(key)
+        if value is not None:
+            store.move_to_end(key)
+            return value
+        value = factory()
+        store[key] = value
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+        return value
+
+    @staticmethod
+    def screen_dpr():
+        screen = QApplication.primaryScreen()
+        return screen.devicePixelRatio() if screen else 1.0
+
+    def pixmap(self, color, size=16, dpr=None):
+        dpr = dpr or self.screen_dpr()
+        key = (color, size, round(dpr, 2))
+        return self._touch(self._pixmaps, key, lambda: self._render(color, size, dpr))
+
+    def icon(self, color, size=16):
+        dpr = self.screen_dpr()
+        key = (color, size, round(dpr, 2))
+
+        def build():
+            icon = QIcon()
+            icon.addPixmap(self.pixmap(color, size, 1.0))
+            if dpr != 1.0:
+                icon.addPixmap(self.pixmap(color, size, dpr))
+            return icon
+
+        return self._touch(self._icons, key, build)
+
+    def clear(self):
+        self._pixmaps.clear()
+        self._icons.clear()
+
+    def _render(self, color, size, dpr):
+        pm = QPixmap(max(1, round(size * dpr)), max(1, round(size * dpr)))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        body = QColor(self.color_hex.get(color, DEFAULT_HEX))
+        pen_w = max(1.0, size / 16)
+        p.setPen(QPen(QColor("#222222"), pen_w))
+        p.setBrush(body)
+        # body + backpack, then visor
+        p.drawRoundedRect(QRectF(size * 0.08, size * 0.38, size * 0.2, size * 0.38), size * 0.06, size * 0.06)
+        p.drawRoundedRect(QRectF(size * 0.22, size * 0.1, size * 0.6, size * 0.82), size * 0.28, size * 0.28)
+        p.setBrush(QColor("#9fd8ef"))
+        p.drawRoundedRect(QRectF(size * 0.46, size * 0.26, size * 0.44, size * 0.24), size * 0.12, size * 0.12)
+        p.end()
+        return pm
+
+_shared = None
+
+def shared_icons(color_hex):
+    global _shared
+    if _shared is None:
+        _shared = IconCache(color_hex)
+    return _shared
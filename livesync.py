@@ -0,0 +1,235 @@
+from PyQt6.QtNetwork import QHostAddress, QTcpServer, QTcpSocket
+from PyQt6.QtCore import QObject, QTimer
+import copy
+import json
+import math
+import uuid
+
+# Wire format: one compact JSON object per line.
+#   {"s": [row, ...]}  snapshot of every record, sent by the server to a new peer
+#   {"d": [row, ...]}  batch of changed records, both directions
+# A row is [key, clock, origin, value]; key is "kind:id" (case, sus, log) and
+# value None marks a deleted record. (clock, origin) orders writes so every
+# peer settles on the same last writer.
+DEFAULT_PORT = 45871
+FLUSH_INTERVAL_MS = 250  # at most four batches per second per connection
+KINDS = ("case", "sus", "log")
+
+def encode(message):
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+def split_key(key):
+    kind, _, rid = key.partition(":")
+    return kind, rid
+
+def _strings(value):
+    return isinstance(value, list) and all(isinstance(v, str) for v in value)
+
+def _valid_case(value):
+    return (isinstance(value, dict)
+            and all(isinstance(value.get(f), str) for f in ("victim", "location", "notes", "timestamp"))
+            and _strings(value.get("suspects"))
+            and isinstance(value.get("session"), (str, type(None)))
+            and _strings(value.get("tags", []))
+            and (value.get("kill_window") is None
+                 or _strings(value["kill_window"]) and len(value["kill_window"]) == 2))
+
+def _valid_value(kind, value):
+    if value is None:
+        return True  # deletion
+    if kind == "case":
+        return _valid_case(value)
+    if kind == "sus":
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+    return _strings(value) and len(value) == 2  # log: [stamp, text]
+
+def valid_row(row):
+    # anything a peer sends is checked before it reaches the merge or the UI
+    if not isinstance(row, list) or len(row) != 4:
+        return False
+    key, clock, origin, value = row
+    if not isinstance(key, str) or not isinstance(origin, str):
+        return False
+    if not isinstance(clock, int) or isinstance(clock, bool):
+        return False
+    kind, rid = split_key(key)
+    return kind in KINDS and bool(rid) and _valid_value(kind, value)
+
+def message_rows(message, field):
+    rows = message.get(field)
+    if not isinstance(rows, list):
+        return []
+    return [row for row in rows if valid_row(row)]
+
+class SyncState:
+    def __init__(self, origin=None):
+        self.origin = origin or uuid.uuid4().hex[:8]
+        self.clock = 0
+        self.records = {}  # key -> [clock, origin, value]
+
+    def set_local(self, key, value):
+        self.clock += 1
+        value = copy.deepcopy(value)
+        self.records[key] = [self.clock, self.origin, value]
+        return [key, self.clock, self.origin, value]
+
+    def merge(self, row):
+        key, clock, origin, value = row
+        current = self.records.get(key)
+        if current is not None and (current[0], current[1]) >= (clock, origin):
+            return False
+        self.records[key] = [clock, origin, value]
+        self.clock = max(self.clock, clock)
+        return True
+
+    def newer_than(self, row):
+        # strictly newer than `row`; an identical row is just an echo
+        current = self.records.get(row[0])
+        return current is not None and (current[0], current[1]) > (row[1], row[2])
+
+    def row(self, key):
+        clock, origin, value = self.records[key]
+        return [key, clock, origin, value]
+
+    def rows(self):
+        return [[k, c, o, v] for k, (c, o, v) in self.records.items()]
+
+class _LineReader:
+    def __init__(self):
+        self.buffer = b""
+
+    def feed(self, data):
+        *lines, self.buffer = (self.buffer + data).split(b"\n")
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(message, dict):
+                yield message
+
+class SyncServer(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.state = SyncState("server")
+        self.server = QTcpServer(self)
+        self.server.newConnection.connect(self._on_new_connection)
+        self.peers = {}  # socket -> (reader, pending rows by key)
+        self.timer = QTimer(self)
+        self.timer.setInterval(FLUSH_INTERVAL_MS)
+        self.timer.timeout.connect(self.flush)
+
+    def listen(self, port=DEFAULT_PORT, lan=False):
+        # loopback only unless the host explicitly opens it to the network
+        address = QHostAddress.SpecialAddress.Any if lan else QHostAddress.SpecialAddress.LocalHost
+        if not self.server.listen(QHostAddress(address), port):
+            return False
+        self.timer.start()
+        return True
+
+    def port(self):
+        return self.server.serverPort()
+
+    def close(self):
+        self.timer.stop()
+        for sock in list(self.peers):
+            sock.disconnectFromHost()
+        self.server.close()
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            sock = self.server.nextPendingConnection()
+            self.peers[sock] = (_LineReader(), {})
+            sock.readyRead.connect(lambda s=sock: self._on_ready_read(s))
+            sock.disconnected.connect(lambda s=sock: self._on_disconnected(s))
+            # late joiners catch up from the current state, not a replay
+            sock.write(encode({"s": self.state.rows()}))
+
+    def _on_disconnected(self, sock):
+        self.peers.pop(sock, None)
+        sock.deleteLater()
+
+    def _on_ready_read(self, sock):
+        peer = self.peers.get(sock)
+        if peer is None:
+            return
+        reader, pending = peer
+        for message in reader.feed(bytes(sock.readAll())):
+            for row in message_rows(message, "d"):
+                if self.state.merge(row):
+                    for other, (_, other_pending) in self.peers.items():
+                        if other is not sock:
+                            other_pending[row[0]] = row
+                elif self.state.newer_than(row):
+                    # the sender lost the race; tell it who won
+                    pending[row[0]] = self.state.row(row[0])
+
+    def flush(self):
+        for sock, (_, pending) in self.peers.items():
+            if pending:
+                sock.write(encode({"d": list(pending.values())}))
+                pending.clear()
+
+class SyncClient(QObject):
+    def __init__(self, state, handler, status_handler=None, parent=None):
+        super().__init__(parent)
+        self.state = state
+        self.handler = handler
+        self.status_handler = status_handler
+        self.reader = _LineReader()
+        self.pending = {}
+        self.sock = QTcpSocket(self)
+        self.sock.connected.connect(self._on_connected)
+        self.sock.disconnected.connect(lambda: self._status("Sync: disconnected"))
+        self.sock.errorOccurred.connect(lambda _: self._status(f"Sync: {self.sock.errorString()}"))
+        self.sock.readyRead.connect(self._on_ready_read)
+        self.timer = QTimer(self)
+        self.timer.setInterval(FLUSH_INTERVAL_MS)
+        self.timer.timeout.connect(self.flush)
+
+    def _status(self, text):
+        if self.status_handler:
+            try:
+                self.status_handler(text)
+            except RuntimeError:
+                pass  # status widget already destroyed during shutdown
+
+    def connect_to(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.address = f"{host}:{port}"
+        self._status(f"Sync: connecting to {self.address}")
+        self.sock.connectToHost(host, port)
+
+    def close(self):
+        self.flush()
+        self.timer.stop()
+        self.sock.disconnectFromHost()
+
+    def is_connected(self):
+        return self.sock.state() == QTcpSocket.SocketState.ConnectedState
+
+    def _on_connected(self):
+        # push whatever was recorded before joining; the server keeps the newest
+        for row in self.state.rows():
+            self.pending.setdefault(row[0], row)
+        self.timer.start()
+        self._status(f"Sync: connected to {self.address}")
+
+    def publish(self, row):
+        # repeated edits of one record inside a flush window collapse into one row
+        self.pending[row[0]] = row
+
+    def flush(self):
+        if self.pending and self.is_connected():
+            self.sock.write(encode({"d": list(self.pending.values())}))
+            self.pending.clear()
+
+    def _on_ready_read(self):
+        applied = []
+        for message in self.reader.feed(bytes(self.sock.readAll())):
+            for row in message_rows(message, "s") + message_rows(message, "d"):
+                if self.state.merge(row):
+                    applied.append(row)
+        if applied:
+            self.handler(applied)
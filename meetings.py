@@ -0,0 +1,183 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget,
+    QTableWidget, QTableWidgetItem, QInputDialog, QHeaderView
+)
+from PyQt6.QtGui import QColor
+from datetime import datetime
+import numpy as np
+
+SKIP = "Skip"
+
+class VoteMatrix:
+    # together[a, b]: meetings where both a and b voted
+    # agree[a, b]:    meetings where a and b voted for the same crewmate
+    # Every vote edit only touches row/column a for the voters of that meeting.
+    def __init__(self, colors):
+        self.colors = list(colors)
+        self.index = {c: i for i, c in enumerate(self.colors)}
+        n = len(self.colors)
+        self.together = np.zeros((n, n), dtype=np.int32)
+        self.agree = np.zeros((n, n), dtype=np.int32)
+
+    def _bump(self, table, a, others, delta):
+        if others:
+            idx = np.fromiter((self.index[o] for o in others), dtype=np.intp, count=len(others))
+            table[a, idx] += delta
+            table[idx, a] += delta
+
+    def set_vote(self, votes, voter, target):
+        # updates the meeting's votes dict in place, returns the touched color pairs
+        a = self.index[voter]
+        old = votes.get(voter)
+        others = [v for v in votes if v != voter]
+        if old is None:
+            self._bump(self.together, a, others, 1)
+        elif old != SKIP:
+            self._bump(self.agree, a, [v for v in others if votes[v] == old], -1)
+        votes[voter] = target
+        if target != SKIP:
+            self._bump(self.agree, a, [v for v in others if votes[v] == target], 1)
+        return [(voter, v) for v in others]
+
+    def remove_vote(self, votes, voter):
+        old = votes.pop(voter, None)
+        if old is None:
+            return []
+        a = self.index[voter]
+        others = list(votes)
+        self._bump(self.together, a, others, -1)
+        if old != SKIP:
+            self._bump(self.agree, a, [v for v in others if votes[v] == old], -1)
+        return [(voter, v) for v in others]
+
+    def rate(self, a, b):
+        ia, ib = self.index[a], self.index[b]
+        both = self.together[ia, ib]
+        return (self.agree[ia, ib] / both) if both else 0.0
+
+    def blocs(self, threshold=0.6, min_meetings=2):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates = np.where(self.together > 0, self.agree / np.maximum(self.together, 1), 0.0)
+        mask = (rates >= threshold) & (self.together >= min_meetings)
+        rows, cols = np.nonzero(np.triu(mask, 1))
+        pairs = [(self.colors[i], self.colors[j], int(self.agree[i, j]), int(self.together[i, j]))
+                 for i, j in zip(rows, cols)]
+        return sorted(pairs, key=lambda p: (-p[2] / p[3], -p[3]))
+
+class MeetingsPanel(QWidget):
+    def __init__(self, colors, case_ids, parent=None):
+        super().__init__(parent)
+        self.colors = list(colors)
+        self.case_ids = case_ids  # callable returning the current case ids
+        self.meetings = []
+        self.matrix = VoteMatrix(self.colors)
+
+        layout = QVBoxLayout()
+        self.meeting_list = QListWidget()
+        self.meeting_list.currentRowChanged.connect(self.refresh_votes)
+        layout.addWidget(QLabel("Meetings"))
+        layout.addWidget(self.meeting_list)
+
+        self.vote_list = QListWidget()
+        layout.addWidget(QLabel("Votes"))
+        layout.addWidget(self.vote_list)
+
+        btn_row = QHBoxLayout()
+        new_btn = QPushButton("New Meeting")
+        new_btn.clicked.connect(self.new_meeting)
+        vote_btn = QPushButton("Record Vote")
+        vote_btn.clicked.connect(self.record_vote)
+        remove_btn = QPushButton("Remove Vote")
+        remove_btn.clicked.connect(self.remove_vote)
+        btn_row.addWidget(new_btn)
+        btn_row.addWidget(vote_btn)
+        btn_row.addWidget(remove_btn)
+        layout.addLayout(btn_row)
+
+        self.table = QTableWidget(len(self.colors), len(self.colors))
+        self.table.setHorizontalHeaderLabels([c[:3] for c in self.colors])
+        self.table.setVerticalHeaderLabels(self.colors)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        for i in range(len(self.colors)):
+            for j in range(len(self.colors)):
+                self.table.setItem(i, j, QTableWidgetItem(""))
+        layout.addWidget(QLabel("Voted together (same target / both voted)"))
+        layout.addWidget(self.table)
+
+        self.bloc_label = QLabel("Blocs: -")
+        self.bloc_label.setWordWrap(True)
+        layout.addWidget(self.bloc_label)
+        self.setLayout(layout)
+
+    def current_meeting(self):
+        row = self.meeting_list.currentRow()
+        return self.meetings[row] if 0 <= row < len(self.meetings) else None
+
+    def new_meeting(self):
+        options = ["(no case)"] + list(self.case_ids())
+        case, ok = QInputDialog.getItem(self, "New Meeting", "Called for case:", options, len(options) - 1, False)
+        if not ok:
+            return
+        self.add_meeting(None if case == options[0] else case)
+
+    def add_meeting(self, case_id=None):
+        meeting = {
+            "number": len(self.meetings) + 1,
+            "timestamp": datetime.now().isoformat(timespec='seconds'),
+            "case": case_id,
+            "votes": {}
+        }
+        self.meetings.append(meeting)
+        label = f"Meeting {meeting['number']} ({meeting['timestamp'][11:]})"
+        self.meeting_list.addItem(f"{label} — {case_id}" if case_id else label)
+        self.meeting_list.setCurrentRow(len(self.meetings) - 1)
+        return meeting
+
+    def record_vote(self):
+        meeting = self.current_meeting()
+        if meeting is None:
+            meeting = self.add_meeting()
+        voter, ok = QInputDialog.getItem(self, "Record Vote", "Voter:", self.colors, 0, False)
+        if not ok:
+            return
+        target, ok = QInputDialog.getItem(self, "Record Vote", f"{voter} voted for:", self.colors + [SKIP], 0, False)
+        if ok:
+            self.cast_vote(meeting, voter, target)
+
+    def cast_vote(self, meeting, voter, target):
+        touched = self.matrix.set_vote(meeting["votes"], voter, target)
+        self.refresh_votes()
+        self.update_cells(touched)
+
+    def remove_vote(self):
+        meeting = self.current_meeting()
+        item = self.vote_list.currentItem()
+        if meeting is None or item is None:
+            return
+        voter = item.text().split(" → ")[0]
+        touched = self.matrix.remove_vote(meeting["votes"], voter)
+        self.refresh_votes()
+        self.update_cells(touched)
+
+    def refresh_votes(self, *_):
+        self.vote_list.clear()
+        meeting = self.current_meeting()
+        if meeting:
+            for voter, target in meeting["votes"].items():
+                self.vote_list.addItem(f"{voter} → {target}")
+
+    def update_cells(self, pairs):
+        # only the cells whose counts changed are repainted
+        for a, b in pairs:
+            for x, y in ((a, b), (b, a)):
+                i, j = self.matrix.index[x], self.matrix.index[y]
+                both = int(self.matrix.together[i, j])
+                same = int(self.matrix.agree[i, j])
+                item = self.table.item(i, j)
+                item.setText(f"{same}/{both}" if both else "")
+                shade = int(255 * (same / both)) if both else 0
+                item.setBackground(QColor(255, 255 - shade, 255 - shade) if both else QColor(0, 0, 0, 0))
+                item.setForeground(QColor("#000000"))
+        blocs = self.matrix.blocs()
+        self.bloc_label.setText("Blocs: " + (", ".join(f"{a}+{b} ({s}/{t})" for a, b, s, t in blocs[:6]) or "-"))
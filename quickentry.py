@@ -0,0 +1,225 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QLabel
+from PyQt6.QtCore import QEvent, Qt
+from bisect import bisect_left
+
+from alibi import parse_killed_ago
+
+# Quick entry grammar:
+#   <victim> <room> [<N>s | <N>-<M>s] [sus] <suspect> ... [: notes]    -> case
+#   log <anything>                                                     -> log entry
+# e.g. "red elec 20-40s sus cyan lime : vented" (killed 20 to 40 seconds ago)
+COLOR_ALIASES = {
+    "blu": "Blue", "grn": "Green", "pnk": "Pink", "org": "Orange", "orng": "Orange",
+    "yel": "Yellow", "ylw": "Yellow", "blk": "Black", "blck": "Black", "wht": "White",
+    "purp": "Purple", "prp": "Purple", "brn": "Brown", "cyn": "Cyan", "mar": "Maroon",
+    "ban": "Banana", "grey": "Gray", "gry": "Gray"
+}
+
+SUSPECT_KEYWORDS = ("sus", "by", "suspects")
+LOG_KEYWORD = "log"
+
+class QuickEntry:
+    def __init__(self, kind):
+        self.kind = kind  # "case" or "log"
+        self.victim = None
+        self.location = None
+        self.suspects = []
+        self.killed = None  # (min, max) seconds before saving
+        self.notes = ""
+        self.text = ""
+        self.errors = []
+
+    @property
+    def ok(self):
+        return not self.errors
+
+class QuickEntryParser:
+    def __init__(self, colors, map_model, color_aliases=COLOR_ALIASES):
+        # every lookup table is built once here; parse() only does dict hits
+        self.colors = {c.lower(): c for c in colors}
+        for alias, color in color_aliases.items():
+            if color in colors:
+                self.colors[alias] = color
+        self.rooms = {}
+        self.room_pairs = {}
+        for key, room in map_model.lookup.items():
+            parts = key.split()
+            if len(parts) == 1:
+                self.rooms[key] = room
+            elif len(parts) == 2:
+                self.room_pairs[(parts[0], parts[1])] = room
+        self.pair_vocab = {}  # first word -> sorted second words
+        for first, second in self.room_pairs:
+            self.pair_vocab.setdefault(first, []).append(second)
+        for seconds in self.pair_vocab.values():
+            seconds.sort()
+        self.keywords = set(SUSPECT_KEYWORDS)
+        self.color_vocab = sorted(self.colors)
+        self.room_vocab = sorted(set(self.rooms) | self.keywords)
+
+    def parse(self, text):
+        head, _, notes = text.partition(":")
+        tokens = head.lower().split()
+        if tokens and tokens[0] == LOG_KEYWORD:
+            entry = QuickEntry("log")
+            # "log saw red" and "log: saw red" both give "saw red"
+            entry.text = text.strip()[len(LOG_KEYWORD):].strip().removeprefix(":").strip()
+            if not entry.text:
+                entry.errors.append("log entry is empty")
+            return entry
+        entry = QuickEntry("case")
+        entry.notes = notes.strip()
+        suspects_mode = False
+        i = 0
+        while i < len(tokens):
+            tok = tokens[i]
+            room = self.room_pairs.get((tok, tokens[i + 1])) if i + 1 < len(tokens) else None
+            step = 2 if room else 1
+            room = room or self.rooms.get(tok)
+            color = self.colors.get(tok)
+            ago = None if room or color else parse_killed_ago(tok)
+            if tok in self.keywords:
+                suspects_mode = True
+            elif color and (suspects_mode or entry.victim):
+                if color == entry.victim:
+                    entry.errors.append(f"{color} is the victim")
+                elif color not in entry.suspects:
+                    entry.suspects.append(color)
+            elif color:
+                entry.victim = color
+            elif room:
+                if entry.location and entry.location != room:
+                    entry.errors.append(f"two rooms: {entry.location}, {room}")
+                entry.location = room
+            elif ago:
+                entry.killed = ago
+            else:
+                entry.errors.append(f"unknown '{tok}'")
+            i += step
+        if not entry.victim:
+            entry.errors.append("no victim color")
+        if not entry.location:
+            entry.errors.append("no room")
+        return entry
+
+    @staticmethod
+    def _prefixed(vocab, prefix, limit):
+        out = []
+        i = bisect_left(vocab, prefix)
+        while i < len(vocab) and len(out) < limit and vocab[i].startswith(prefix):
+            out.append(vocab[i])
+            i += 1
+        return out
+
+    def completions(self, prefix, rooms_first=False, limit=8):
+        prefix = prefix.lower()
+        first, second = (self.room_vocab, self.color_vocab) if rooms_first else (self.color_vocab, self.room_vocab)
+        out = self._prefixed(first, prefix, limit)
+        return out + self._prefixed(second, prefix, limit - len(out))
+
+    def complete(self, text):
+        # full-line completion for the token under the cursor (end of text)
+        if not text or text[-1].isspace() or ":" in text:
+            return None
+        head, _, last = text.rpartition(" ")
+        word = last.lower()
+        if head.lower().split()[:1] == [LOG_KEYWORD] or word in self.colors or word in self.rooms or word in self.keywords:
+            return None
+        prev = head.lower().split()[-1:]
+        seconds = self.pair_vocab.get(prev[0]) if prev else None
+        if seconds is not None:
+            # "lower e" finishes the two-word room; a second room here is never valid
+            cands = self._prefixed(seconds, word, 1) or self._prefixed(self.color_vocab, word, 1)
+        else:
+            # after the victim a room is expected, otherwise colors are more likely
+            context = self.parse(head)
+            rooms_first = bool(context.victim) and not context.location
+            cands = self.completions(word, rooms_first)
+        for cand in cands:
+            return (head + " " if head else "") + last + cand[len(last):]
+        return None
+
+    def describe(self, entry):
+        if entry.kind == "log":
+            return f"log: {entry.text}"
+        parts = [entry.victim or "?", "@", entry.location or "?"]
+        if entry.killed:
+            low, high = entry.killed
+            parts.append(f"killed {low}s ago" if low == high else f"killed {low}-{high}s ago")
+        if entry.suspects:
+            parts.append("sus " + ", ".join(entry.suspects))
+        if entry.notes:
+            parts.append(f"— {entry.notes}")
+        return " ".join(parts)
+
+class _QuickLine(QLineEdit):
+    # Space and Tab accept a pending inline completion instead of replacing it
+    def _accept_completion(self):
+        if self.hasSelectedText() and self.selectionStart() + len(self.selectedText()) == len(self.text()):
+            self.setCursorPosition(len(self.text()))
+            return True
+        return False
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_Space:
+            self._accept_completion()
+        super().keyPressEvent(event)
+
+    def event(self, event):
+        if (event.type() == QEvent.Type.KeyPress and event.key() == Qt.Key.Key_Tab
+                and event.modifiers() == Qt.KeyboardModifier.NoModifier and self._accept_completion()):
+            return True
+        return super().event(event)
+
+class QuickEntryBar(QWidget):
+    def __init__(self, parser, callback, parent=None):
+        super().__init__(parent)
+        self.parser = parser
+        self.callback = callback
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.input = _QuickLine()
+        self.input.setPlaceholderText("Quick entry: red elec 30s sus cyan lime : vented")
+        self.input.textEdited.connect(self.on_edited)
+        self.input.returnPressed.connect(self.submit)
+        self.status = QLabel("")
+        self.status.setStyleSheet("font-size: 10px;")
+        layout.addWidget(self.input)
+        layout.addWidget(self.status)
+        self.setLayout(layout)
+        self._last_text = ""
+
+    def on_edited(self, text):
+        grew = len(text) > len(self._last_text)
+        self._last_text = text
+        if grew:
+            completed = self.parser.complete(text)
+            if completed:
+                # inline completion: typed part stays, suggested suffix is selected
+                self.input.setText(completed)
+                self.input.setSelection(len(text), len(completed) - len(text))
+        self.show_status(self.parser.parse(self.input.text()) if text.strip() else None)
+
+    def show_status(self, entry):
+        if entry is None:
+            self.status.setText("")
+        elif entry.ok:
+            self.status.setStyleSheet("font-size: 10px; color: #33cc33;")
+            self.status.setText(self.parser.describe(entry))
+        else:
+            self.status.setStyleSheet("font-size: 10px; color: #ff4d4d;")
+            self.status.setText("; ".join(entry.errors))
+
+    def submit(self):
+        # accepting keeps a pending inline completion, like Tab would
+        text = self.input.text()
+        if not text.strip():
+            return
+        entry = self.parser.parse(text)
+        self.show_status(entry)
+        if not entry.ok:
+            return
+        self.callback(entry)
+        self.input.clear()
+        self._last_text = ""
+        self.status.setText("")
@@ -0,0 +1,121 @@
+from PyQt6.QtCore import QObject, QTimer
+from bisect import bisect_right
+import copy
+import time
+
+from livesync import split_key
+
+# Events use the same "kind:id" keys as live sync; value None deletes the record.
+KEYFRAME_EVERY = 256
+TICK_MS = 50
+SPEEDS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+def empty_state():
+    return {"case": {}, "sus": {}, "log": {}}
+
+def copy_state(state):
+    # values are never mutated once recorded, so copying the tables is enough
+    return {kind: dict(table) for kind, table in state.items()}
+
+def apply_event(state, key, value):
+    kind, rid = split_key(key)
+    table = state.get(kind)
+    if table is None:
+        return
+    if value is None:
+        table.pop(rid, None)
+    else:
+        table[rid] = value
+
+class EventRecorder:
+    def __init__(self, keyframe_every=KEYFRAME_EVERY):
+        self.keyframe_every = keyframe_every
+        self.times = []
+        self.events = []      # (key, value)
+        self.keyframes = []   # (events applied, state)
+        self.keyframe_positions = []
+        self._state = empty_state()
+
+    def __len__(self):
+        return len(self.events)
+
+    def record(self, key, value, when=None):
+        value = copy.deepcopy(value)
+        t = time.time() if when is None else when
+        if self.times and t < self.times[-1]:
+            t = self.times[-1]  # keep the stream monotonic for bisecting
+        self.times.append(t)
+        self.events.append((key, value))
+        apply_event(self._state, key, value)
+        if len(self.events) % self.keyframe_every == 0:
+            self.keyframes.append((len(self.events), copy_state(self._state)))
+            self.keyframe_positions.append(len(self.events))
+
+    def span(self):
+        if not self.times:
+            return None
+        return self.times[0], self.times[-1]
+
+    def index_at(self, t):
+        return bisect_right(self.times, t)
+
+    def state_at(self, t):
+        # nearest keyframe at or before t, then only the remaining deltas
+        n = self.index_at(t)
+        k = bisect_right(self.keyframe_positions, n) - 1
+        if k >= 0:
+            start, snapshot = self.keyframes[k]
+            state = copy_state(snapshot)
+        else:
+            start, state = 0, empty_state()
+        self.advance(state, start, n)
+        return state, n
+
+    def advance(self, state, start, end):
+        for key, value in self.events[start:end]:
+            apply_event(state, key, value)
+
+class ReplayController(QObject):
+    def __init__(self, recorder, show_state, parent=None):
+        super().__init__(parent)
+        self.recorder = recorder
+        self.show_state = show_state  # callback(state, position, changed)
+        self.speed = 1.0
+        self.position = 0.0
+        self.applied = 0
+        self.state = empty_state()
+        self.timer = QTimer(self)
+        self.timer.setInterval(TICK_MS)
+        self.timer.timeout.connect(self._tick)
+
+    def is_playing(self):
+        return self.timer.isActive()
+
+    def play(self):
+        span = self.recorder.span()
+        if span and self.position >= span[1]:
+            self.seek(span[0])
+        self.timer.start()
+
+    def pause(self):
+        self.timer.stop()
+
+    def seek(self, t):
+        self.position = t
+        self.state, self.applied = self.recorder.state_at(t)
+        self.show_state(self.state, t, True)
+
+    def _tick(self):
+        span = self.recorder.span()
+        if not span:
+            self.pause()
+            return
+        self.position = min(self.position + TICK_MS / 1000 * self.speed, span[1])
+        n = self.recorder.index_at(self.position)
+        changed = n != self.applied
+        if changed:
+            self.recorder.advance(self.state, self.applied, n)
+            self.applied = n
+        if self.position >= span[1]:
+            self.pause()
+        self.show_state(self.state, self.position, changed)
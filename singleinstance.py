@@ -0,0 +1,120 @@
+from PyQt6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+from PyQt6.QtCore import QObject
+import argparse
+import getpass
+import json
+import sys
+
+# One JSON object per line, e.g. {"action": "log", "text": "red vented"}
+ACTIONS = ("show", "overlay", "log", "open", "host_sync", "join_sync")
+
+def server_name(app_id):
+    # per-user so two accounts on one machine don't talk to each other
+    return f"{app_id}-{getpass.getuser()}"
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="AmogBook")
+    parser.add_argument("--show", action="store_true", help="bring the full window to the front")
+    parser.add_argument("--overlay", action="store_true", help="show the overlay")
+    parser.add_argument("--log", metavar="TEXT", action="append", default=[], help="add a log entry")
+    parser.add_argument("--open", metavar="CASE_ID", help="select and open a case")
+    parser.add_argument("--host-sync", metavar="PORT", type=int, help="host a live sync server")
+    parser.add_argument("--sync-lan", action="store_true", help="let other machines join the hosted sync server")
+    parser.add_argument("--join-sync", metavar="HOST:PORT", help="join a live sync server")
+    parser.add_argument("--new-instance", action="store_true", help="start a separate instance")
+    # Qt consumes its own options (-platform, -style ...), ignore anything unknown
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+def commands_from_args(args):
+    commands = []
+    if args.show:
+        commands.append({"action": "show"})
+    if args.overlay:
+        commands.append({"action": "overlay"})
+    for text in args.log:
+        commands.append({"action": "log", "text": text})
+    if args.open:
+        commands.append({"action": "open", "case": args.open})
+    if args.host_sync:
+        commands.append({"action": "host_sync", "port": args.host_sync, "lan": args.sync_lan})
+    if args.join_sync:
+        host, _, port = args.join_sync.rpartition(":")
+        if port.isdigit():
+            commands.append({"action": "join_sync", "host": host or "127.0.0.1", "port": int(port)})
+    return commands
+
+def forward_to_running(name, commands, timeout_ms=150):
+    # True if another instance took the commands; the caller should then exit
+    sock = QLocalSocket()
+    sock.connectToServer(name)
+    if not sock.waitForConnected(timeout_ms):
+        return False
+    payload = "".join(json.dumps(c, separators=(",", ":")) + "\n" for c in commands)
+    sock.write(payload.encode("utf-8"))
+    sock.flush()
+    sock.waitForBytesWritten(timeout_ms)
+    sock.disconnectFromServer()
+    if sock.state() != QLocalSocket.LocalSocketState.UnconnectedState:
+        sock.waitForDisconnected(timeout_ms)
+    return True
+
+def hand_off(app_id, default_action):
+    # Called before the UI modules are imported, so a second launch only pays
+    # for this module. Exits if a running instance took the commands.
+    name = server_name(app_id)
+    args = parse_args(sys.argv[1:])
+    commands = commands_from_args(args)
+    if not args.new_instance and forward_to_running(name, commands or [{"action": default_action}]):
+        sys.exit(0)
+    return name, args, commands
+
+class InstanceServer(QObject):
+    def __init__(self, name, handler, parent=None):
+        super().__init__(parent)
+        self.handler = handler
+        self._buffers = {}
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self._on_new_connection)
+        if not self.server.listen(name) and self._is_stale(name):
+            # socket file left behind by a crashed instance
+            QLocalServer.removeServer(name)
+            self.server.listen(name)
+
+    def _is_stale(self, name):
+        # a racing launch may own the name; only clear it if nobody answers
+        if self.server.serverError() != QAbstractSocket.SocketError.AddressInUseError:
+            return False
+        probe = QLocalSocket()
+        probe.connectToServer(name)
+        if probe.waitForConnected(150):
+            probe.disconnectFromServer()
+            return False
+        return True
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            sock = self.server.nextPendingConnection()
+            self._buffers[sock] = b""
+            sock.readyRead.connect(lambda s=sock: self._on_ready_read(s))
+            sock.disconnected.connect(lambda s=sock: self._on_disconnected(s))
+
+    def _on_disconnected(self, sock):
+        if sock.bytesAvailable():
+            self._on_ready_read(sock)
+        self._buffers.pop(sock, None)
+        sock.deleteLater()
+
+    def _on_ready_read(self, sock):
+        buf = self._buffers.get(sock, b"") + bytes(sock.readAll())
+        *lines, rest = buf.split(b"\n")
+        self._buffers[sock] = rest
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                command = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(command, dict) and command.get("action") in ACTIONS:
+                self.handler(command)
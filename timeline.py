@@ -0,0 +1,241 @@
+from PyQt6.QtWidgets import QWidget, QToolTip
+from PyQt6.QtGui import QColor, QPainter, QPen
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+import math
+import time
+
+from alibi import to_seconds
+
+LANES = ("case", "log", "sus")
+LANE_TITLES = {"case": "Cases", "log": "Log", "sus": "Sus"}
+LANE_COLORS = {"case": "#ff4d4d", "log": "#4d9fff", "sus": "#ff9900"}
+MIN_EVENT_PX = 6   # closer than this and the lane switches to aggregated bins
+BIN_PX = 4
+MIN_SPAN = 2.0
+MAX_SPAN = 30 * 86400  # zoom-out limit unless the events themselves cover more
+AXIS_STEPS = (1, 5, 10, 30, 60, 300, 600, 1800, 3600, 7200, 21600, 43200, 86400, 7 * 86400, 30 * 86400)
+
+class EventIndex:
+    # Sorted by time so any visible window is two bisects away; events
+    # almost always arrive in order, which makes insort an append.
+    def __init__(self):
+        self.times = []
+        self.items = []
+
+    def __len__(self):
+        return len(self.times)
+
+    def add(self, t, item):
+        if not self.times or t >= self.times[-1]:
+            self.times.append(t)
+            self.items.append(item)
+            return
+        i = bisect_right(self.times, t)
+        self.times.insert(i, t)
+        self.items.insert(i, item)
+
+    def remove(self, t, item):
+        # only the events stamped exactly t are scanned
+        lo, hi = self.span(t, t)
+        for i in range(lo, hi):
+            if self.items[i] == item:
+                del self.times[i]
+                del self.items[i]
+                return True
+        return False
+
+    def span(self, t0, t1):
+        return bisect_left(self.times, t0), bisect_right(self.times, t1)
+
+    def count(self, t0, t1):
+        lo, hi = self.span(t0, t1)
+        return hi - lo
+
+class TimelineWidget(QWidget):
+    def __init__(self, color_hex, parent=None):
+        super().__init__(parent)
+        self.color_hex = color_hex
+        self.lanes = {lane: EventIndex() for lane in LANES}
+        self.view_start = time.time() - 300
+        self.view_end = time.time() + 60
+        self.follow = True  # keep the newest event in view until the user pans
+        self._drag_x = None
+        self.setMinimumHeight(160)
+        self.setMouseTracking(True)
+
+    # ---------- data ----------
+    def add_event(self, lane, when, label, color=None):
+        t = to_seconds(when)
+        if t is None:
+            return
+        self.lanes[lane].add(t, (label, color))
+        if self.follow and t > self.view_end - 5:
+            width = self.view_end - self.view_start
+            self.view_end = t + width * 0.1
+            self.view_start = self.view_end - width
+        self.update()
+
+    def remove_event(self, lane, when, label, color=None):
+        t = to_seconds(when)
+        if t is not None and self.lanes[lane].remove(t, (label, color)):
+            self.update()
+
+    def clear(self):
+        self.lanes = {lane: EventIndex() for lane in LANES}
+        self.update()
+
+    def data_span(self):
+        times = [idx.times for idx in self.lanes.values() if idx.times]
+        if not times:
+            return None
+        return min(t[0] for t in times), max(t[-1] for t in times)
+
+    def fit_all(self):
+        span = self.data_span()
+        if not span:
+            return
+        lo, hi = span
+        pad = max(5.0, (hi - lo) * 0.05)
+        self.view_start, self.view_end = lo - pad, hi + pad
+        self.follow = True
+        self.update()
+
+    # ---------- geometry ----------
+    def _x(self, t):
+        return (t - self.view_start) / (self.view_end - self.view_start) * self.width()
+
+    def _t(self, x):
+        return self.view_start + x / max(1, self.width()) * (self.view_end - self.view_start)
+
+    def _lane_rect(self, i):
+        top = 22
+        h = (self.height() - top) / len(LANES)
+        return QRectF(0, top + i * h, self.width(), h)
+
+    # ---------- painting ----------
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.fillRect(self.rect(), QColor("#1e1e1e"))
+        self._paint_axis(p)
+        for i, lane in enumerate(LANES):
+            rect = self._lane_rect(i)
+            p.setPen(QColor("#444444"))
+            p.drawLine(QPointF(0, rect.bottom()), QPointF(rect.right(), rect.bottom()))
+            p.setPen(QColor("#aaaaaa"))
+            p.drawText(rect.adjusted(4, 2, 0, 0), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, LANE_TITLES[lane])
+            idx = self.lanes[lane]
+            visible = idx.count(self.view_start, self.view_end)
+            if visible * MIN_EVENT_PX > self.width():
+                self._paint_bins(p, idx, rect, LANE_COLORS[lane])
+            else:
+                self._paint_events(p, idx, rect, LANE_COLORS[lane], visible)
+        p.end()
+
+    def _paint_axis(self, p):
+        span = self.view_end - self.view_start
+        ticks = max(2, self.width() // 90)
+        step = next((s for s in AXIS_STEPS if span / s <= ticks), None)
+        if step is None:
+            step = math.ceil(span / ticks / AXIS_STEPS[-1]) * AXIS_STEPS[-1]
+        fmt = "%H:%M:%S" if step < 60 else "%H:%M" if step < 86400 else "%m-%d"
+        p.setPen(QColor("#777777"))
+        t = (self.view_start // step + 1) * step
+        while t < self.view_end:
+            x = self._x(t)
+            p.drawLine(QPointF(x, 16), QPointF(x, self.height()))
+            try:
+                label = datetime.fromtimestamp(t).strftime(fmt)
+            except (OverflowError, OSError, ValueError):
+                label = ""
+            p.drawText(QPointF(x + 2, 12), label)
+            t += step
+
+    def _paint_events(self, p, idx, rect, lane_hex, visible):
+        lo, hi = idx.span(self.view_start, self.view_end)
+        cy = rect.center().y() + 6
+        show_labels = visible * 80 < self.width()
+        for i in range(lo, hi):
+            label, color = idx.items[i]
+            x = self._x(idx.times[i])
+            p.setPen(QPen(QColor("#222222"), 1))
+            p.setBrush(QColor(self.color_hex.get(color, lane_hex)))
+            p.drawEllipse(QPointF(x, cy), 5, 5)
+            if show_labels:
+                p.setPen(QColor("#dddddd"))
+                p.drawText(QPointF(x + 8, cy + 4), label[:24])
+
+    def _paint_bins(self, p, idx, rect, lane_hex):
+        # level of detail: one bar per BIN_PX columns, height ~ event count
+        bins = max(1, self.width() // BIN_PX)
+        counts = []
+        lo = bisect_left(idx.times, self.view_start)
+        for b in range(bins):
+            hi = bisect_left(idx.times, self._t((b + 1) * BIN_PX), lo)
+            counts.append(hi - lo)
+            lo = hi
+        peak = max(counts) or 1
+        usable = rect.height() - 20
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(QColor(lane_hex))
+        for b, c in enumerate(counts):
+            if c:
+                h = max(2.0, usable * c / peak)
+                p.drawRect(QRectF(b * BIN_PX, rect.bottom() - h, BIN_PX - 1, h))
+
+    # ---------- interaction ----------
+    def wheelEvent(self, event):
+        if event.angleDelta().y() == 0:
+            event.ignore()  # horizontal scroll or a sideways swipe is not a zoom
+            return
+        factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+        anchor = self._t(event.position().x())
+        data = self.data_span()
+        limit = max(MAX_SPAN, (data[1] - data[0]) * 3) if data else MAX_SPAN
+        span = min(limit, max(MIN_SPAN, (self.view_end - self.view_start) * factor))
+        ratio = event.position().x() / max(1, self.width())
+        self.view_start = anchor - span * ratio
+        self.view_end = self.view_start + span
+        self.follow = False
+        self.update()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_x = event.position().x()
+
+    def mouseReleaseEvent(self, event):
+        self._drag_x = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.fit_all()
+
+    def mouseMoveEvent(self, event):
+        x = event.position().x()
+        if self._drag_x is not None:
+            shift = self._t(self._drag_x) - self._t(x)
+            self.view_start += shift
+            self.view_end += shift
+            self._drag_x = x
+            self.follow = False
+            self.update()
+            return
+        self._show_tooltip(event)
+
+    def _show_tooltip(self, event):
+        pos = event.position()
+        for i, lane in enumerate(LANES):
+            if not self._lane_rect(i).contains(pos):
+                continue
+            idx = self.lanes[lane]
+            lo, hi = idx.span(self._t(pos.x() - 6), self._t(pos.x() + 6))
+            if hi - lo == 1:
+                label, _ = idx.items[lo]
+                stamp = datetime.fromtimestamp(idx.times[lo]).strftime("%H:%M:%S")
+                QToolTip.showText(event.globalPosition().toPoint(), f"[{stamp}] {label}", self)
+            elif hi - lo > 1:
+                QToolTip.showText(event.globalPosition().toPoint(), f"{hi - lo} {LANE_TITLES[lane].lower()} events", self)
+            else:
+                QToolTip.hideText()
+            return